@@ -6,33 +6,72 @@
 """
 
 import time
+import json
+import re
+import hashlib
+import io
+import math
 import logging
 import sys
 import os
 import asyncio
+import shutil
+import threading
 from datetime import datetime
-from typing import Optional
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from typing import TYPE_CHECKING, Callable, Optional
+from urllib.parse import urlsplit, urlunsplit, urlencode, parse_qsl
+# Исключения Selenium легкие; сам WebDriver импортируется только при первом запуске браузера
 from selenium.common.exceptions import (
     TimeoutException,
     NoSuchElementException,
     WebDriverException
 )
 
+if TYPE_CHECKING:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.support.ui import WebDriverWait
+
 try:
     # Для python-telegram-bot >= 20.0
     from telegram import Bot
     from telegram.error import TelegramError
+    from telegram.request import HTTPXRequest
 except ImportError:
     # Для старых версий
     import telegram
     from telegram.error import TelegramError
     Bot = telegram.Bot
+    HTTPXRequest = None
+
+try:
+    # Быстрый HTTP-путь без браузера (необязательные зависимости)
+    import httpx
+    import lxml.html
+    from lxml import etree
+    from lxml.etree import XPath
+    from lxml.cssselect import CSSSelector
+    HTTP_FAST_PATH_AVAILABLE = True
+    try:
+        import h2  # noqa: F401  (нужен httpx для HTTP/2)
+        HTTP2_AVAILABLE = True
+    except ImportError:
+        HTTP2_AVAILABLE = False
+except ImportError:
+    # Без httpx/lxml страница всегда загружается через браузер
+    HTTP_FAST_PATH_AVAILABLE = False
+    HTTP2_AVAILABLE = False
+
+try:
+    # BLAKE3 (SIMD) для сравнения текста элемента; без пакета - BLAKE2b той же длины
+    import blake3
+    
+    def text_digest(text: str) -> bytes:
+        return blake3.blake3(text.encode('utf-8')).digest(length=16)
+except ImportError:
+    def text_digest(text: str) -> bytes:
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
 
 try:
     # Python 3.9+
@@ -57,23 +96,94 @@ except ImportError:
 
 # Настройка кодировки для Windows
 import platform
-if platform.system() == 'Windows':
-    import io
+IS_WINDOWS = platform.system() == 'Windows'
+if IS_WINDOWS:
     # Устанавливаем UTF-8 для stdout на Windows
     if sys.stdout.encoding != 'utf-8':
         sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     if sys.stderr.encoding != 'utf-8':
         sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
+# User-Agent для браузера и HTTP-запросов (в зависимости от ОС)
+if IS_WINDOWS:
+    USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+else:
+    USER_AGENT = 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
+
+# История изменений отслеживаемых элементов (для адаптивного интервала проверок)
+HISTORY_PATH = os.path.join(os.path.expanduser('~'), '.web_monitor_history.json')
+# Постоянные профили Chrome (HTTP-кэш на диске) и размер дискового кэша
+CHROME_PROFILE_ROOT = os.getenv(
+    'CHROME_PROFILE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'web_monitor_chrome')
+)
+CHROME_DISK_CACHE_SIZE = 50 * 1024 * 1024
+
+# Результат быстрого HTTP-пути: страница получена, но элемента в HTML нет
+NOT_IN_HTML = object()
+# Результат быстрого HTTP-пути: страница не изменилась с прошлой проверки (304 или свежий ответ)
+UNCHANGED = object()
+
+# Максимальная длина сообщения Telegram
+TELEGRAM_MAX_MESSAGE = 4096
+
+# Ресурсы, которые не нужны для чтения текста элемента и блокируются в браузере
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*.mp4', '*.webm', '*.mp3',
+    '*.css',
+]
+
+# Шаблоны уведомлений по типу сообщения (подстановки: time, expected, current)
+TEMPLATES = {
+    'changed': (
+        "⚠️ Элемент изменился!\n\n"
+        "Время: {time} (МСК)\n"
+        "Ожидался: {expected}\n"
+        "Найден: {current}"
+    ),
+    'missing': (
+        "⚠️ Элемент отсутствует!\n\n"
+        "Время: {time} (МСК)\n"
+        "Ожидался элемент с текстом: {expected}\n"
+        "Элемент не найден на странице"
+    ),
+    'found_again': (
+        "✅ Элемент снова найден!\n\n"
+        "Время: {time} (МСК)\n"
+        "Текст: {current}"
+    ),
+    'ok': (
+        "✅ Элемент на месте!\n\n"
+        "Время: {time} (МСК)\n"
+        "Текст: {current}\n"
+        "Всё в порядке."
+    ),
+    # Стандартное уведомление об изменении
+    'default': (
+        "⚠️ Элемент изменился\n\n"
+        "Время: {time} (МСК)\n"
+        "Новый текст: {current}"
+    ),
+}
+# Подстановка, если текст элемента пустой
+EMPTY_TEXT = {'found_again': 'найден', 'ok': 'найден'}
+
+# Замена эмодзи для Windows консоли (один проход регулярным выражением)
+_EMOJI_SUB = {'⚠️': '[WARNING]', '✅': '[OK]', '❌': '[ERROR]'}
+_EMOJI_RE = re.compile('|'.join(map(re.escape, _EMOJI_SUB)))
+
 # Настройка логирования
 class SafeStreamHandler(logging.StreamHandler):
     """StreamHandler с безопасной обработкой Unicode для Windows"""
     def emit(self, record):
+        if not IS_WINDOWS:
+            return super().emit(record)
         try:
             msg = self.format(record)
             stream = self.stream
             # Убираем эмодзи для совместимости с Windows консолью
-            msg = msg.replace('⚠️', '[WARNING]').replace('✅', '[OK]').replace('❌', '[ERROR]')
+            msg = _EMOJI_RE.sub(lambda m: _EMOJI_SUB[m.group()], msg)
             stream.write(msg + self.terminator)
             self.flush()
         except UnicodeEncodeError:
@@ -99,7 +209,8 @@ logger = logging.getLogger(__name__)
 class WebMonitor:
     """Класс для мониторинга веб-страницы и отправки уведомлений в Telegram"""
     
-    def __init__(self, url: str, selector: str, telegram_token: str, chat_id: str, expected_text: Optional[str] = None):
+    def __init__(self, url: str, selector: str, telegram_token: str, chat_id: str, expected_text: Optional[str] = None,
+                 clock: Optional[Callable[[], datetime]] = None):
         """
         Инициализация монитора
         
@@ -109,21 +220,421 @@ class WebMonitor:
             telegram_token: Токен Telegram бота
             chat_id: ID чата для отправки уведомлений
             expected_text: Ожидаемый текст элемента (если задан, проверяется наличие этого текста)
+            clock: Источник текущего времени для уведомлений (по умолчанию - время по Москве)
         """
         self.url = url
         self.selector = selector
         self.telegram_token = telegram_token
         self.chat_id = chat_id
         self.expected_text = expected_text
-        self.previous_text: Optional[str] = None
-        self.driver: Optional[webdriver.Chrome] = None
-        self.bot = Bot(token=telegram_token)
-        self.element_found_last_time = True  # Флаг для отслеживания, был ли элемент найден в прошлый раз
-        self.last_ok_notification_time = 0  # Время последнего "OK" уведомления
-        self.ok_notification_interval = 180  # Интервал между "OK" уведомлениями (3 минуты)
-        
-    def _setup_driver(self) -> webdriver.Chrome:
-        """Настройка и создание Chrome WebDriver"""
+        # Ожидаемый текст для сравнения без учета регистра (casefold корректно работает и с кириллицей)
+        self._expected_cf = expected_text.casefold() if expected_text else None
+        # Для обнаружения изменений хранится хеш текста, а не сам текст
+        self._previous_hash: Optional[bytes] = None
+        self._previous_preview = ''  # Начало предыдущего текста для логов
+        self.driver: Optional['webdriver.Remote'] = None
+        self._service: Optional['Service'] = None  # Долгоживущий процесс chromedriver
+        # Браузеры пула создаются параллельно в потоках - chromedriver должен запускаться один раз
+        self._service_lock = threading.Lock()
+        self._wait: Optional['WebDriverWait'] = None  # Ожидание элемента для текущего драйвера
+        self._presence_cond = None  # Условие появления элемента (создается вместе с первым драйвером)
+        self._navigated_once = False  # Страница уже открыта в текущем драйвере
+        # Страница обновляет элемент сама (SPA/XHR): после первой загрузки она не перезагружается
+        self.live_page = os.getenv('LIVE_PAGE', 'false').lower() == 'true'
+        self.bot = self._create_bot(telegram_token)
+        # Текущее состояние элемента: (состояние, проверок подряд, время начала) или None до первой проверки
+        self._state: Optional[tuple] = None
+        self.digest_every = max(1, int(os.getenv('DIGEST_EVERY', '20')))  # Сводка о неизменном состоянии раз в N проверок
+        self.element_wait_timeout = 10  # Ожидание появления элемента после загрузки страницы (секунды)
+        
+        # Адаптивный интервал проверок: бюджет проверок в сутки распределяется
+        # с учетом истории изменений элемента
+        self.poll_interval = float(os.getenv('POLL_INTERVAL', '180'))  # Пока истории изменений недостаточно
+        self.min_poll_interval = 60
+        self.max_poll_interval = 1800
+        self.polls_per_day = int(os.getenv('POLLS_PER_DAY', str(int(86400 // self.poll_interval))))
+        # Пока истории нет: после stable_after проверок без изменений интервал удваивается
+        self.stable_after = 3
+        self.stable_max_interval = float(os.getenv('STABLE_MAX_INTERVAL', '900'))
+        
+        # Экспоненциальная задержка после ошибок: poll_interval * backoff_base ** ошибок подряд
+        self.backoff_base = float(os.getenv('BACKOFF_BASE', '1.3'))
+        self.backoff_max = float(os.getenv('BACKOFF_MAX', '900'))
+        self.max_history = 100
+        self.change_history = self._load_change_history()
+        self._change_fit = self._fit_change_distribution()
+        
+        # Обход кэша браузера при каждой проверке (параметр _nocache в URL)
+        self.force_fresh = os.getenv('FORCE_FRESH', 'false').lower() == 'true'
+        self._split = urlsplit(url)
+        self._base_qs = parse_qsl(self._split.query, keep_blank_values=True)
+        
+        # Уведомления отправляет отдельная задача asyncio, чтобы задержки Telegram не тормозили проверки
+        self.telegram_max_retries = 5
+        self.telegram_batch_window = 2  # Окно объединения уведомлений (секунды)
+        self.clock = clock or (lambda: datetime.now(MOSCOW_TZ))
+        self._tg_queue: asyncio.Queue = asyncio.Queue(maxsize=64)
+        self._tg_task: Optional[asyncio.Task] = None
+        
+        # Тип селектора определяется один раз, а не при каждой проверке
+        self._selector_kind = self._classify_selector(selector)
+        # Селектор компилируется один раз; поиск по тексту идет потоковым разбором без запроса
+        self._fast_query = self._compile_fast_query() if HTTP_FAST_PATH_AVAILABLE else None
+        self._fast_enabled = HTTP_FAST_PATH_AVAILABLE and (
+            self._fast_query is not None or (self._selector_kind == 'auto' and bool(expected_text))
+        )
+        self._http: Optional['httpx.AsyncClient'] = None  # HTTP-клиент быстрого пути (создается при первой проверке)
+        self._etag: Optional[str] = None
+        self._last_mod: Optional[str] = None
+        self._fresh_until = 0.0  # До этого времени ответ свежий по Cache-Control и запрос не нужен
+        self.use_browser = False  # Элемент рендерится JavaScript'ом - быстрый HTTP-путь пропускается
+        self._static_page = False  # Элемент уже находили в HTML без JavaScript
+        self.pool: Optional['BrowserPool'] = None  # Общий пул браузеров при мониторинге нескольких URL
+        
+        # Последнее известное состояние сохраняется на диск, чтобы перезапуск не вызывал ложных уведомлений
+        self._url_id = hashlib.sha1(url.encode('utf-8')).hexdigest()[:8]
+        self._state_path = os.path.join(os.path.expanduser('~'), f'.webmonitor_{self._url_id}.json')
+        self._saved_state: Optional[dict] = None
+        self._load_state()
+    
+    @staticmethod
+    def _create_bot(telegram_token: str) -> Bot:
+        """Создание Telegram бота с пулом keep-alive соединений"""
+        if HTTPXRequest is None:
+            return Bot(token=telegram_token)
+        request = HTTPXRequest(
+            connection_pool_size=4,
+            http_version='2' if HTTP2_AVAILABLE else '1.1'
+        )
+        return Bot(token=telegram_token, request=request)
+    
+    @staticmethod
+    def _classify_selector(selector: Optional[str]) -> str:
+        """
+        Определение типа селектора
+        
+        Returns:
+            'auto' (поиск по тексту), 'xpath' или 'css'
+        """
+        if not selector or selector == 'auto':
+            return 'auto'
+        if selector.startswith('//') or selector.startswith('(//'):
+            return 'xpath'
+        return 'css'
+    
+    @staticmethod
+    def _selenium_locator(selector: Optional[str], kind: str) -> tuple:
+        """
+        Определение локатора Selenium для селектора
+        
+        Args:
+            selector: Селектор элемента
+            kind: Тип селектора из _classify_selector
+            
+        Returns:
+            Кортеж (By, значение) для presence_of_element_located
+        """
+        from selenium.webdriver.common.by import By
+        
+        selector = selector or ''
+        if kind == 'xpath':
+            return By.XPATH, selector
+        if selector.startswith('#') and all(c.isalnum() or c in '-_' for c in selector[1:]):
+            # Простой ID селектор
+            return By.ID, selector[1:]
+        return By.CSS_SELECTOR, selector
+    
+    def _compile_fast_query(self):
+        """
+        Компиляция селектора для разбора HTML через lxml
+        
+        Returns:
+            Скомпилированный XPath/CSS запрос или None (поиск по тексту или неподдерживаемый селектор)
+        """
+        try:
+            if self._selector_kind == 'auto':
+                return None
+            if self._selector_kind == 'xpath':
+                return XPath(self.selector)
+            return CSSSelector(self.selector)
+        except Exception as e:
+            logger.warning(f"Селектор '{self.selector}' не поддерживается быстрым HTTP-путём: {e}")
+            return None
+    
+    async def _fetch_fast(self) -> Optional[str]:
+        """
+        Получение текста элемента прямым HTTP-запросом без браузера
+        
+        Запрос выполняется асинхронным клиентом в event loop, разбор HTML - в пуле потоков.
+        
+        Returns:
+            Текст элемента; NOT_IN_HTML, если страница получена, но элемента в HTML нет
+            (его рисует JavaScript); UNCHANGED, если страница не изменилась с прошлой проверки;
+            None при ошибке запроса или статусе != 200
+        """
+        if not self._fast_enabled:
+            return None
+        
+        # Валидаторы и свежесть относятся к результату прошлой проверки - без него они бесполезны
+        known = self._state is not None and (self.expected_text or self._previous_hash is not None)
+        
+        # Пока ответ свежий по Cache-Control: max-age, запрос к серверу не нужен
+        if known and time.time() < self._fresh_until:
+            logger.debug("Быстрый HTTP-путь: ответ еще свежий (Cache-Control), запрос пропущен")
+            return UNCHANGED
+        
+        try:
+            if self._http is None:
+                # Один клиент на все проверки: соединение и TLS-сессия переиспользуются
+                self._http = httpx.AsyncClient(
+                    http2=HTTP2_AVAILABLE,
+                    headers={'User-Agent': USER_AGENT},
+                    timeout=10,
+                    follow_redirects=True
+                )
+            
+            # Условный запрос: если страница не менялась, сервер ответит 304 без тела
+            headers = {}
+            if known:
+                if self._etag:
+                    headers['If-None-Match'] = self._etag
+                if self._last_mod:
+                    headers['If-Modified-Since'] = self._last_mod
+            resp = await self._http.get(self.url, headers=headers)
+            
+            if resp.status_code == 304 and known:
+                logger.debug("Быстрый HTTP-путь: страница не изменилась (304)")
+                self._fresh_until = time.time() + self._freshness_lifetime(resp.headers)
+                return UNCHANGED
+            
+            if resp.status_code != 200:
+                logger.debug("Быстрый HTTP-путь: статус %s", resp.status_code)
+                return None
+            
+            # Валидаторы описывают результат этой проверки; если понадобится браузер, _check_page их сбросит
+            self._etag = resp.headers.get('ETag')
+            self._last_mod = resp.headers.get('Last-Modified')
+            self._fresh_until = time.time() + self._freshness_lifetime(resp.headers)
+            
+            encoding = self._response_encoding(resp)
+            # Поиск по тексту: если текста нет в ответе, разбирать HTML незачем.
+            # Сравнение без учета регистра, как в _check_expected_text; при кодировке из <meta> не проверяем
+            if self._selector_kind == 'auto' and encoding and not self._contains_needle(resp.content, encoding):
+                logger.debug("Быстрый HTTP-путь: текст отсутствует в HTML")
+                return NOT_IN_HTML
+            
+            text = await asyncio.to_thread(self._extract_text, resp.content, encoding)
+            if text is None:
+                logger.debug("Быстрый HTTP-путь: элемент не найден в HTML (возможно, нужен JavaScript)")
+                return NOT_IN_HTML
+            
+            text = self._normalize(text)
+            logger.debug("Получен текст элемента (HTTP): %.50s...", text)
+            self._static_page = True
+            return text
+            
+        except Exception as e:
+            logger.debug("Быстрый HTTP-путь не удался: %s", e)
+            return None
+    
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """
+        Приведение текста элемента к единому виду (пробельные символы схлопываются)
+        
+        Быстрый HTTP-путь и браузер возвращают текст с разными переносами строк;
+        без нормализации смена пути давала бы другой хеш и ложное уведомление.
+        """
+        return ' '.join(text.split())
+    
+    @staticmethod
+    def _response_encoding(resp) -> Optional[str]:
+        """
+        Кодировка HTML-ответа для lxml
+        
+        Returns:
+            Кодировка из Content-Type, utf-8 если она не объявлена нигде,
+            или None - тогда lxml возьмет ее из <meta charset>
+        """
+        if resp.charset_encoding:
+            return resp.charset_encoding
+        # Без объявления lxml читает байты как latin-1 и портит кириллицу
+        if b'charset' not in resp.content[:2048].lower():
+            return 'utf-8'
+        return None
+    
+    def _contains_needle(self, html: bytes, encoding: str) -> bool:
+        """
+        Есть ли ожидаемый текст в теле ответа (без учета регистра)
+        
+        Returns:
+            False только если текста точно нет; при неизвестной кодировке - True
+        """
+        try:
+            return self._expected_cf in html.decode(encoding, errors='replace').casefold()
+        except LookupError:
+            return True
+    
+    def _extract_text(self, html: bytes, encoding: Optional[str] = None) -> Optional[str]:
+        """
+        Поиск элемента в HTML, полученном быстрым HTTP-путём
+        
+        Args:
+            html: Тело HTTP-ответа
+            encoding: Кодировка ответа (None - определяется по <meta charset>)
+            
+        Returns:
+            Текст элемента или None, если элемент не найден
+        """
+        if self._selector_kind == 'auto':
+            # Поиск по тексту не требует всего дерева: потоковый разбор до первого совпадения
+            return self._find_first(html, self._expected_cf, encoding)
+        parser = lxml.html.HTMLParser(encoding=encoding) if encoding else None
+        matches = self._fast_query(lxml.html.fromstring(html, parser=parser))
+        if not matches:
+            return None
+        node = matches[0]
+        return node if isinstance(node, str) else node.text_content()
+    
+    @staticmethod
+    def _find_first(html: bytes, needle: str, encoding: Optional[str] = None) -> Optional[str]:
+        """
+        Потоковый поиск первого элемента, собственный текст которого содержит needle (без учета регистра)
+        
+        В отличие от lxml.html.fromstring дерево не строится целиком: разобранные элементы
+        освобождаются, а разбор прекращается на первом совпадении.
+        
+        Args:
+            html: Тело HTTP-ответа
+            needle: Искомый текст, приведенный через casefold()
+            encoding: Кодировка ответа (None - определяется по <meta charset>)
+            
+        Returns:
+            Собственный текст найденного элемента или None
+        """
+        events = etree.iterparse(io.BytesIO(html), events=('end',), html=True, recover=True, encoding=encoding)
+        for _, elem in events:
+            if elem.text and needle in elem.text.casefold():
+                return elem.text
+            # Освобождаем элемент и уже обработанных соседей - память не растет с размером страницы
+            elem.clear(keep_tail=True)
+            parent = elem.getparent()
+            while parent is not None and elem.getprevious() is not None:
+                del parent[0]
+        return None
+    
+    @staticmethod
+    def _freshness_lifetime(headers) -> float:
+        """
+        Оставшееся время свежести ответа по Cache-Control: max-age (с учетом Age)
+        
+        Returns:
+            Количество секунд или 0, если ответ нельзя использовать без запроса
+        """
+        directives = [d.strip().lower() for d in headers.get('Cache-Control', '').split(',')]
+        if 'no-cache' in directives or 'no-store' in directives:
+            return 0
+        for directive in directives:
+            if directive.startswith('max-age='):
+                try:
+                    max_age = int(directive[len('max-age='):].strip('"'))
+                    age = int(headers.get('Age', '0'))
+                except ValueError:
+                    return 0
+                return max(0, max_age - age)
+        return 0
+    
+    async def _close_http(self):
+        """Закрытие HTTP-клиента быстрого пути"""
+        try:
+            if self._http is not None:
+                await self._http.aclose()
+                self._http = None
+        except Exception as e:
+            logger.warning(f"Ошибка при закрытии HTTP-клиента: {e}")
+    
+    @staticmethod
+    def _cdp(driver, cmd: str, params: Optional[dict] = None) -> dict:
+        """Выполнение команды Chrome DevTools Protocol (работает и для webdriver.Remote)"""
+        return driver.execute('executeCdpCommand', {'cmd': cmd, 'params': params or {}})['value']
+    
+    def _ensure_service(self, options: 'Options') -> Optional['Service']:
+        """
+        Запуск долгоживущего процесса chromedriver (один на все сессии браузера)
+        
+        Args:
+            options: Настройки Chrome (по ним Selenium Manager подбирает версию chromedriver)
+        
+        Returns:
+            Запущенный Service или None, если chromedriver не удалось найти
+        """
+        with self._service_lock:
+            return self._ensure_service_locked(options)
+    
+    def _ensure_service_locked(self, options: 'Options') -> Optional['Service']:
+        """Проверка и запуск chromedriver (вызывается под _service_lock)"""
+        if self._service is not None:
+            if self._service.is_connectable():
+                return self._service
+            logger.warning("Процесс chromedriver не отвечает, перезапускаем...")
+            self._stop_service()
+        
+        from selenium.webdriver.chrome.service import Service
+        
+        path = os.getenv('CHROMEDRIVER_PATH') or shutil.which('chromedriver') or self._find_driver_path(options)
+        if not path:
+            return None
+        
+        service = Service(executable_path=path)
+        service.start()
+        logger.info(f"chromedriver запущен: {service.service_url}")
+        self._service = service
+        return service
+    
+    @staticmethod
+    def _find_driver_path(options: 'Options') -> Optional[str]:
+        """
+        Поиск chromedriver через Selenium Manager (как это делает webdriver.Chrome)
+        
+        Returns:
+            Путь к chromedriver или None, если Selenium Manager недоступен или не нашел драйвер
+        """
+        from selenium.webdriver.chrome.service import Service
+        
+        try:
+            from selenium.webdriver.common.driver_finder import DriverFinder
+            if hasattr(DriverFinder, 'get_driver_path'):
+                path = DriverFinder(Service(), options).get_driver_path()
+            else:
+                # Selenium 4.11-4.19
+                path = DriverFinder.get_path(Service(), options)
+        except Exception as e:
+            logger.warning(f"Selenium Manager не нашел chromedriver: {e}")
+            return None
+        logger.info(f"chromedriver найден через Selenium Manager: {path}")
+        return path
+    
+    def _stop_service(self):
+        """Остановка процесса chromedriver"""
+        try:
+            if self._service is not None:
+                self._service.stop()
+        except Exception as e:
+            logger.warning(f"Ошибка при остановке chromedriver: {e}")
+        self._service = None
+    
+    def _setup_driver(self, slot: int = 0, persistent_profile: bool = True) -> 'webdriver.Remote':
+        """
+        Настройка и создание Chrome WebDriver
+        
+        Args:
+            slot: Номер браузера в пуле (у одновременно работающих браузеров разные профили)
+            persistent_profile: Использовать постоянный профиль (False - временный профиль chromedriver)
+        """
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+        from selenium.webdriver.chrome.options import Options
+        
         chrome_options = Options()
         
         # Проверяем, нужно ли запускать в headless режиме
@@ -137,45 +648,83 @@ class WebMonitor:
         chrome_options.add_argument('--disable-gpu')
         chrome_options.add_argument('--window-size=1920,1080')
         
-        # Отключаем кэш для получения свежих данных каждый раз
-        chrome_options.add_argument('--disable-application-cache')
-        chrome_options.add_argument('--disable-cache')
-        chrome_options.add_argument('--aggressive-cache-discard')
+        # Изоляция сессии (без cookies/storage прошлых загрузок) - вместо очистки при каждой проверке
+        if os.getenv('INCOGNITO', 'false').lower() == 'true':
+            chrome_options.add_argument('--incognito')
+        elif persistent_profile:
+            # Постоянный профиль: HTTP-кэш и cookies переживают перезапуски браузера.
+            # Профиль занимает один браузер, поэтому каталог свой для каждого URL и места в пуле
+            profile_dir = os.path.join(CHROME_PROFILE_ROOT, self._url_id if not slot else f'{self._url_id}-{slot}')
+            os.makedirs(profile_dir, exist_ok=True)
+            chrome_options.add_argument(f'--user-data-dir={profile_dir}')
+            chrome_options.add_argument(f'--disk-cache-size={CHROME_DISK_CACHE_SIZE}')
+        
+        # Не ждем загрузки картинок/счетчиков: driver.get() возвращается после DOMContentLoaded,
+        # а появление нужного элемента ожидается явно в _get_element_text/_find_element_by_text
+        chrome_options.page_load_strategy = 'eager'
+        
         chrome_options.add_argument('--disable-background-networking')
         
-        # Определяем user-agent в зависимости от ОС
-        import platform
-        if platform.system() == 'Windows':
-            chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-        else:
-            chrome_options.add_argument('--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36')
+        # Картинки, стили, шрифты и медиа не нужны для чтения текста - запрещаем их настройками профиля
+        # (дополнительно к блокировке URL через CDP в конце настройки); JavaScript остается включен
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.managed_default_content_settings.stylesheets': 2,
+            'profile.managed_default_content_settings.fonts': 2,
+            'profile.managed_default_content_settings.plugins': 2,
+            'profile.managed_default_content_settings.media_stream': 2,
+        })
+        
+        chrome_options.add_argument(f'--user-agent={USER_AGENT}')
         
         # Отключаем логирование Chrome
         chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         
-        # Отключаем кэш через preferences
-        prefs = {
-            "profile.default_content_setting_values": {
-                "images": 2,  # Разрешаем изображения, но отключаем кэш
-            },
-            "profile.managed_default_content_settings": {
-                "images": 2
-            }
-        }
-        chrome_options.add_experimental_option("prefs", prefs)
+        # Предпочитаем Chromium (быстрее запускается), путь можно задать через CHROME_BINARY
+        binary = os.getenv('CHROME_BINARY') or shutil.which('chromium') or shutil.which('chromium-browser')
+        if binary:
+            chrome_options.binary_location = binary
+            logger.info(f"Используется браузер: {binary}")
         
         try:
-            # Пытаемся найти chromedriver в системе
-            service = Service()
-            driver = webdriver.Chrome(service=service, options=chrome_options)
+            service = self._ensure_service(chrome_options)
+            if service is not None:
+                # Новая сессия в уже запущенном chromedriver - без повторного старта процесса
+                driver = webdriver.Remote(command_executor=service.service_url, options=chrome_options)
+            else:
+                # Долгоживущий chromedriver запустить не удалось - отдельный процесс на эту сессию
+                driver = webdriver.Chrome(service=Service(), options=chrome_options)
             
             # Устанавливаем таймауты для операций
             driver.set_page_load_timeout(30)  # 30 секунд на загрузку страницы
-            driver.implicitly_wait(10)  # 10 секунд на поиск элементов
+            # Неявное ожидание отключено: оно складывается с явными WebDriverWait
+            driver.implicitly_wait(0)
+            
+            # HTTP-кэш браузера включен: повторные загрузки используют ETag/Last-Modified
+            try:
+                self._cdp(driver, 'Network.setCacheDisabled', {'cacheDisabled': False})
+            except Exception as e:
+                logger.debug("Не удалось настроить кэш через CDP: %s", e)
+            
+            # Блокируем картинки, шрифты, медиа и стили на сетевом уровне
+            try:
+                self._cdp(driver, 'Network.enable', {})
+                self._cdp(driver, 'Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+            except Exception as e:
+                logger.debug("Не удалось заблокировать лишние ресурсы через CDP: %s", e)
             
             logger.info("ChromeDriver успешно инициализирован")
             return driver
+        except WebDriverException as e:
+            # Профиль держит зависший браузер, который не удалось закрыть, или параллельный запуск:
+            # без временного профиля все повторные попытки завершались бы той же ошибкой
+            if persistent_profile and 'user data directory is already in use' in str(e):
+                logger.warning("Профиль Chrome занят другим браузером, запускаем с временным профилем")
+                return self._setup_driver(slot, persistent_profile=False)
+            logger.error(f"Ошибка при создании WebDriver: {e}")
+            raise
         except Exception as e:
             logger.error(f"Ошибка при создании WebDriver: {e}")
             raise
@@ -188,39 +737,16 @@ class WebMonitor:
             Текст элемента или None в случае ошибки
         """
         try:
-            # Определяем тип селектора (таймаут 5 секунд)
-            if self.selector.startswith('//') or self.selector.startswith('(//'):
-                # XPath
-                element = WebDriverWait(self.driver, 5).until(
-                    EC.presence_of_element_located((By.XPATH, self.selector))
-                )
-            elif self.selector.startswith('#'):
-                # ID селектор
-                element = WebDriverWait(self.driver, 5).until(
-                    EC.presence_of_element_located((By.ID, self.selector[1:]))
-                )
-            elif self.selector.startswith('.'):
-                # CSS класс
-                element = WebDriverWait(self.driver, 5).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, self.selector))
-                )
-            else:
-                # CSS селектор или другой
-                element = WebDriverWait(self.driver, 5).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, self.selector))
-                )
-            
-            text = element.text.strip()
-            logger.debug(f"Получен текст элемента: {text[:50]}...")
+            # Локатор и условие подготовлены в __init__, ожидание - при запуске драйвера (_attach_driver)
+            text = self._normalize(self._wait.until(self._presence_cond).text)
+            logger.debug("Получен текст элемента: %.50s...", text)
             return text
             
-        except TimeoutException:
-            logger.warning(f"Элемент с селектором '{self.selector}' не найден на странице (таймаут)")
-            return None
-        except NoSuchElementException:
-            logger.warning(f"Элемент с селектором '{self.selector}' не найден на странице")
+        except (TimeoutException, NoSuchElementException):
+            logger.warning("Элемент с селектором '%s' не найден на странице", self.selector)
             return None
-        except Exception as e:
+        except WebDriverException as e:
+            # Прочие ошибки (не WebDriver) обрабатывает _check_page
             logger.error(f"Ошибка при получении текста элемента: {e}")
             return None
     
@@ -235,212 +761,352 @@ class WebMonitor:
             Текст найденного элемента или None
         """
         try:
-            # Ищем элемент, содержащий указанный текст (уменьшаем таймаут до 5 секунд)
-            xpath = f"//*[contains(text(), '{text}')]"
-            element = WebDriverWait(self.driver, 5).until(
-                EC.presence_of_element_located((By.XPATH, xpath))
-            )
-            found_text = element.text.strip()
-            logger.debug(f"Найден элемент с текстом: {found_text[:50]}...")
+            # Условие ожидания опрашивается многократно, поэтому только встроенный поиск Chromium:
+            # без передачи page_source и разбора HTML в процессе на каждой итерации
+            found_text = self._wait.until(lambda driver: self._cdp_text_search(text))
+            logger.debug("Найден элемент с текстом: %.50s...", found_text)
             return found_text
         except (TimeoutException, NoSuchElementException):
-            logger.warning(f"Элемент с текстом '{text}' не найден на странице")
+            logger.warning("Элемент с текстом '%s' не найден на странице", text)
             return None
         except Exception as e:
             logger.error(f"Ошибка при поиске элемента по тексту: {e}")
             return None
     
-    def _send_telegram_notification(self, message_type: str, current_text: Optional[str] = None):
+    def _cdp_text_search(self, text: str) -> Optional[str]:
+        """
+        Поиск текста через поиск Chromium по DOM (CDP DOM.performSearch)
+        
+        В отличие от XPath contains(text(), ...) находит текст, разбитый на несколько узлов.
+        
+        Args:
+            text: Текст для поиска
+            
+        Returns:
+            Видимый текст первого элемента, содержащего искомый текст, или None
+        """
+        # Запрос документа обязателен перед поиском (после навигации он новый)
+        self._cdp(self.driver, 'DOM.getDocument', {'depth': 0})
+        search = self._cdp(self.driver, 'DOM.performSearch', {'query': text})
+        search_id = search['searchId']
+        try:
+            # Совпадения бывают и в атрибутах, поэтому проверяем несколько первых результатов
+            count = min(search['resultCount'], 10)
+            if not count:
+                return None
+            node_ids = self._cdp(
+                self.driver, 'DOM.getSearchResults', {'searchId': search_id, 'fromIndex': 0, 'toIndex': count}
+            )['nodeIds']
+            
+            needle = text.casefold()
+            for node_id in node_ids:
+                remote = self._cdp(self.driver, 'DOM.resolveNode', {'nodeId': node_id})['object']
+                result = self._cdp(self.driver, 'Runtime.callFunctionOn', {
+                    'objectId': remote['objectId'],
+                    'functionDeclaration': (
+                        'function() {'
+                        ' const el = this.nodeType === Node.TEXT_NODE ? this.parentElement : this;'
+                        ' return el ? el.innerText : null; }'
+                    ),
+                    'returnByValue': True,
+                })['result']
+                found = result.get('value')
+                if found and needle in found.casefold():
+                    return self._normalize(found)
+            return None
+        finally:
+            self._cdp(self.driver, 'DOM.discardSearchResults', {'searchId': search_id})
+    
+    def _send_telegram_notification(self, message_type: str, current_text: Optional[str] = None, note: str = ''):
         """
-        Отправка уведомления в Telegram
+        Постановка уведомления в очередь на отправку в Telegram (не блокирует проверку)
         
         Args:
             message_type: Тип сообщения ('changed', 'missing', 'found_again')
             current_text: Текущий текст элемента (если есть)
+            note: Дополнительная строка в конце сообщения (сводка)
         """
         try:
-            # Получаем текущее время по Москве
-            if MOSCOW_TZ:
-                moscow_time = datetime.now(MOSCOW_TZ).strftime('%Y-%m-%d %H:%M')
+            self._tg_queue.put_nowait((message_type, current_text, note))
+        except asyncio.QueueFull:
+            logger.error(f"Очередь уведомлений Telegram переполнена, уведомление '{message_type}' пропущено")
+    
+    async def _telegram_worker(self):
+        """
+        Фоновая задача, отправляющая уведомления из очереди
+        
+        Уведомления, пришедшие в течение telegram_batch_window секунд, объединяются
+        (повторы отбрасываются) и отправляются одним сообщением.
+        """
+        while True:
+            batch = [await self._tg_queue.get()]
+            if batch[0] is not None:
+                await asyncio.sleep(self.telegram_batch_window)
+            while not self._tg_queue.empty():
+                batch.append(self._tg_queue.get_nowait())
+            try:
+                items = list(dict.fromkeys(item for item in batch if item is not None))
+                if items:
+                    await self._deliver_notification(items)
+                if None in batch:
+                    break
+            finally:
+                for _ in batch:
+                    self._tg_queue.task_done()
+    
+    def _format_message(self, moscow_time: str, message_type: str, current_text: Optional[str], note: str = '') -> str:
+        """Формирование текста уведомления (время вычисляется один раз на пачку уведомлений)"""
+        template = TEMPLATES.get(message_type, TEMPLATES['default'])
+        if current_text:
+            current = current_text[:200]
+        else:
+            current = EMPTY_TEXT.get(message_type, 'не найден')
+        message = template.format_map({
+            'time': moscow_time,
+            'expected': self.expected_text,
+            'current': current,
+        })
+        if note:
+            message += f"\n\n{note}"
+        return message
+    
+    async def _send_message(self, message: str):
+        """Отправка сообщения в чат"""
+        # Поддерживаем как Chat ID (число), так и username канала (строка с @)
+        chat_id = self.chat_id
+        # Если это строка и начинается с @, используем как username
+        if isinstance(chat_id, str) and chat_id.startswith('@'):
+            await self.bot.send_message(chat_id=chat_id, text=message)
+        else:
+            # Иначе используем как Chat ID (число)
+            await self.bot.send_message(chat_id=int(chat_id), text=message)
+    
+    async def _deliver_notification(self, items: list):
+        """
+        Отправка пачки уведомлений в Telegram
+        
+        Args:
+            items: Список (message_type, current_text, note) без повторов
+        """
+        try:
+            moscow_time = self.clock().strftime('%Y-%m-%d %H:%M')
+            messages = [self._format_message(moscow_time, *item) for item in items]
+        except Exception as e:
+            logger.error(f"Ошибка при формировании уведомления: {e}")
+            return
+        
+        # Склеиваем уведомления, не превышая лимит длины сообщения Telegram
+        combined = [messages[0]]
+        for message in messages[1:]:
+            if len(combined[-1]) + len(message) + 2 > TELEGRAM_MAX_MESSAGE:
+                combined.append(message)
             else:
-                moscow_time = datetime.now().strftime('%Y-%m-%d %H:%M')
-            
-            if message_type == 'changed':
-                message = (
-                    f"⚠️ Элемент изменился!\n\n"
-                    f"Время: {moscow_time} (МСК)\n"
-                    f"Ожидался: {self.expected_text}\n"
-                    f"Найден: {current_text[:200] if current_text else 'не найден'}"
-                )
-            elif message_type == 'missing':
-                message = (
-                    f"⚠️ Элемент отсутствует!\n\n"
-                    f"Время: {moscow_time} (МСК)\n"
-                    f"Ожидался элемент с текстом: {self.expected_text}\n"
-                    f"Элемент не найден на странице"
-                )
-            elif message_type == 'found_again':
-                message = (
-                    f"✅ Элемент снова найден!\n\n"
-                    f"Время: {moscow_time} (МСК)\n"
-                    f"Текст: {current_text[:200] if current_text else 'найден'}"
-                )
-            elif message_type == 'ok':
-                message = (
-                    f"✅ Элемент на месте!\n\n"
-                    f"Время: {moscow_time} (МСК)\n"
-                    f"Текст: {current_text[:200] if current_text else 'найден'}\n"
-                    f"Всё в порядке."
+                combined[-1] += f"\n\n{message}"
+        
+        for message in combined:
+            await self._send_with_retries(message)
+    
+    async def _send_with_retries(self, message: str):
+        """
+        Отправка сообщения в Telegram с повторами при ошибках
+        
+        Args:
+            message: Текст сообщения
+        """
+        for attempt in range(1, self.telegram_max_retries + 1):
+            try:
+                await self._send_message(message)
+                logger.info("Уведомление успешно отправлено в Telegram")
+                return
+            except TelegramError as e:
+                if attempt == self.telegram_max_retries:
+                    logger.error(f"Ошибка при отправке сообщения в Telegram: {e}")
+                    return
+                # Экспоненциальная задержка перед повтором
+                delay = min(2 ** attempt, 60)
+                logger.warning(
+                    f"Ошибка при отправке сообщения в Telegram: {e}. "
+                    f"Повтор через {delay} сек. (попытка {attempt}/{self.telegram_max_retries})"
                 )
+                await asyncio.sleep(delay)
+            except Exception as e:
+                logger.error(f"Неожиданная ошибка при отправке в Telegram: {e}")
+                return
+    
+    def _fetch_with_browser(self) -> Optional[str]:
+        """
+        Загрузка страницы через браузер и получение текста элемента
+        
+        Фиксированных пауз после загрузки нет: содержимое, которое дорисовывает JavaScript,
+        дожидается явное ожидание (WebDriverWait с expected conditions) в _lookup_element_text,
+        и оно завершается, как только элемент появился.
+        
+        Returns:
+            Текст элемента или None, если элемент не найден
+        """
+        # Браузер запускается только при первой необходимости
+        if self.driver is None:
+            self._attach_driver(self._setup_driver())
+        
+        # Загружаем страницу (таймаут загрузки задан в _setup_driver)
+        try:
+            if self._navigated_once and self.live_page:
+                # Страница сама обновляет содержимое (XHR) - только повторно ищем элемент
+                logger.debug("Страница уже открыта, перезагрузка не нужна")
+            elif self._navigated_once and not self.force_fresh:
+                # Тот же URL уже открыт: refresh дешевле новой навигации и использует кэш браузера (304)
+                self.driver.refresh()
             else:
-                # Стандартное уведомление об изменении
-                message = (
-                    f"⚠️ Элемент изменился\n\n"
-                    f"Время: {moscow_time} (МСК)\n"
-                    f"Новый текст: {current_text[:200] if current_text else 'не найден'}"
-                )
-            
-            # В python-telegram-bot 20+ методы асинхронные
-            # Создаем новый event loop для каждого вызова
-            try:
-                loop = asyncio.get_running_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-            
-            async def send_async():
-                # Поддерживаем как Chat ID (число), так и username канала (строка с @)
-                chat_id = self.chat_id
-                # Если это строка и начинается с @, используем как username
-                if isinstance(chat_id, str) and chat_id.startswith('@'):
-                    await self.bot.send_message(chat_id=chat_id, text=message)
-                else:
-                    # Иначе используем как Chat ID (число)
-                    await self.bot.send_message(chat_id=int(chat_id), text=message)
-            
-            loop.run_until_complete(send_async())
-            logger.info("Уведомление успешно отправлено в Telegram")
-            
-        except TelegramError as e:
-            logger.error(f"Ошибка при отправке сообщения в Telegram: {e}")
+                # Обход кэша включается только явно (FORCE_FRESH=true),
+                # иначе повторные загрузки используют прогретый кэш браузера
+                url = self.url
+                if self.force_fresh:
+                    logger.debug("Жесткое обновление страницы: %s", self.url)
+                    # Добавляем timestamp к URL для обхода кэша браузера (фрагмент #... сохраняется в конце)
+                    query = urlencode(self._base_qs + [('_nocache', str(int(time.time() * 1000)))])
+                    url = urlunsplit(self._split._replace(query=query))
+                self.driver.get(url)
+                self._navigated_once = True
+        except TimeoutException:
+            logger.warning("Таймаут при загрузке страницы, пробуем продолжить...")
+            # Продолжаем работу даже при таймауте - возможно страница частично загрузилась
         except Exception as e:
-            logger.error(f"Неожиданная ошибка при отправке в Telegram: {e}")
+            logger.warning("Ошибка при загрузке страницы: %s, пробуем продолжить...", e)
+            # Продолжаем работу даже при ошибке
+        
+        return self._lookup_element_text()
+    
+    def _lookup_element_text(self) -> Optional[str]:
+        """Поиск элемента на загруженной в браузере странице"""
+        if self.expected_text and self._selector_kind == 'auto':
+            return self._find_element_by_text(self.expected_text)
+        return self._get_element_text()
     
-    def _check_page(self) -> bool:
+    async def _fetch_browser_text(self) -> Optional[str]:
+        """Получение текста через собственный браузер или браузер, взятый на время из общего пула"""
+        if self.pool is None:
+            return await asyncio.to_thread(self._fetch_with_browser)
+        
+        driver = await self.pool.acquire()
+        try:
+            # Браузер мог открывать другой URL, поэтому страница загружается заново
+            self._attach_driver(driver)
+            text = await asyncio.to_thread(self._fetch_with_browser)
+            # Ошибки загрузки и поиска перехватываются внутри, поэтому упавший браузер проверяем отдельно
+            if text is None and not await asyncio.to_thread(self._driver_alive, driver):
+                raise WebDriverException("браузер не отвечает")
+        except WebDriverException as e:
+            # Сломанный браузер не возвращается в пул, иначе на нем будут падать все мониторы
+            logger.warning(f"Браузер из пула удален: {e}")
+            await self.pool.discard(driver)
+            raise
+        except asyncio.CancelledError:
+            # Поток to_thread продолжает работать с этим браузером - вернуть его в пул нельзя
+            await asyncio.shield(self.pool.discard(driver))
+            raise
+        except BaseException:
+            self.pool.release(driver)
+            raise
+        else:
+            self.pool.release(driver)
+            return text
+        finally:
+            self.driver = None
+    
+    @staticmethod
+    def _driver_alive(driver) -> bool:
+        """Отвечает ли браузер на команды WebDriver"""
+        try:
+            driver.current_url
+            return True
+        except WebDriverException:
+            return False
+    
+    async def _check_page(self) -> bool:
         """
         Проверка страницы на изменения
         
+        HTTP-запрос быстрого пути выполняется асинхронно в event loop; блокирующие вызовы
+        (Selenium и разбор HTML через lxml) - в пуле потоков, чтобы не останавливать
+        event loop с отправкой уведомлений.
+        
         Returns:
             True если проверка прошла успешно, False в случае ошибки
         """
         try:
-            # Устанавливаем таймауты для операций
-            self.driver.set_page_load_timeout(30)  # 30 секунд на загрузку страницы
-            self.driver.implicitly_wait(5)  # 5 секунд на поиск элементов
-            
-            # Полностью очищаем cookies и кэш перед каждой проверкой
-            logger.debug("Очистка cookies и кэша браузера...")
-            try:
-                # Очищаем cookies с таймаутом (не критично если не получится)
-                self.driver.delete_all_cookies()
-            except Exception as e:
-                logger.debug(f"Не удалось очистить cookies (продолжаем): {e}")
-                # Продолжаем работу даже если не удалось очистить cookies
-            
-            # Очищаем кэш через JavaScript (если страница уже загружена)
-            try:
-                current_url = self.driver.current_url
-                if current_url and current_url != "data:,":
-                    self.driver.execute_script("window.localStorage.clear();")
-                    self.driver.execute_script("window.sessionStorage.clear();")
-            except Exception as e:
-                logger.debug(f"Не удалось очистить storage: {e}")
-            
-            # Жестко обновляем страницу с очисткой кэша
-            logger.debug(f"Жесткое обновление страницы: {self.url}")
-            # Добавляем timestamp к URL для обхода кэша браузера
-            import urllib.parse
-            url_with_cache_bust = self.url
-            if '?' in url_with_cache_bust:
-                url_with_cache_bust += f"&_nocache={int(time.time() * 1000)}"
-            else:
-                url_with_cache_bust += f"?_nocache={int(time.time() * 1000)}"
+            # Сначала пробуем быстрый HTTP-путь, браузер - только если он не сработал
+            # или уже известно, что элемент появляется только после выполнения JavaScript
+            current_text = None if self.use_browser else await self._fetch_fast()
+            # Только страница без элемента в HTML переключает на браузер; сбой запроса (таймаут, 5xx) - нет
+            not_in_html = current_text is NOT_IN_HTML
+            if not_in_html and self.expected_text and self._static_page:
+                # Раньше элемент находился в HTML без JavaScript - значит, он пропал, браузер не нужен
+                logger.debug("Элемент отсутствует в HTML статической страницы")
+                current_text = None
+            elif current_text is None or not_in_html:
+                # Результат браузера не связан с валидаторами HTTP-ответа
+                self._etag = self._last_mod = None
+                self._fresh_until = 0.0
+                current_text = await self._fetch_browser_text()
+                if current_text is not None and not_in_html:
+                    logger.info("Элемент отсутствует в HTML без JavaScript, дальше проверяем только через браузер")
+                    self.use_browser = True
             
-            # Загружаем страницу с обходом кэша и таймаутом
-            try:
-                self.driver.set_page_load_timeout(30)
-                self.driver.get(url_with_cache_bust)
-            except TimeoutException:
-                logger.warning("Таймаут при загрузке страницы, пробуем продолжить...")
-                # Продолжаем работу даже при таймауте - возможно страница частично загрузилась
-            except Exception as e:
-                logger.warning(f"Ошибка при загрузке страницы: {e}, пробуем продолжить...")
-                # Продолжаем работу даже при ошибке
-            
-            # Дополнительно очищаем кэш через JavaScript после загрузки
-            try:
-                self.driver.execute_script("""
-                    if ('caches' in window) {
-                        caches.keys().then(function(names) {
-                            for (let name of names) caches.delete(name);
-                        });
-                    }
-                """)
-            except Exception as e:
-                logger.debug(f"Не удалось очистить кэш через JS: {e}")
-            
-            # Ждем полной загрузки страницы (уменьшаем время ожидания)
-            time.sleep(2)  # Уменьшаем время ожидания
-            
-            # Дополнительно ждем, пока страница полностью загрузится (с меньшим таймаутом)
-            try:
-                WebDriverWait(self.driver, 5).until(
-                    lambda driver: driver.execute_script('return document.readyState') == 'complete'
-                )
-            except TimeoutException:
-                logger.warning("Страница загружается дольше ожидаемого, продолжаем...")
-                # Продолжаем работу даже если страница не полностью загрузилась
+            # Страница не изменилась (304 или ответ еще свежий): повторяем результат прошлой проверки
+            unchanged = current_text is UNCHANGED
+            if unchanged:
+                logger.debug("Страница не изменилась, текст элемента прежний")
             
             # Если задан ожидаемый текст, используем специальную логику проверки
             if self.expected_text:
-                return self._check_expected_text()
+                if unchanged:
+                    return self._check_expected_text(self._previous_preview, self._state[0])
+                return self._check_expected_text(current_text)
             
             # Стандартная логика: проверка изменения текста
-            current_text = self._get_element_text()
-            
             if current_text is None:
                 logger.warning("Не удалось получить текст элемента, пропускаем проверку")
                 return False
             
-            # Сравниваем с предыдущим значением
-            if self.previous_text is None:
-                logger.info(f"Первая проверка. Текущий текст: {current_text[:50]}...")
+            # Сравниваем хеш с предыдущим значением; для уведомлений достаточно начала текста
+            if unchanged:
+                current_text = self._previous_preview
+                current_hash = self._previous_hash
+            else:
+                current_hash = text_digest(current_text)
+            preview = current_text[:200]
+            
+            if self._previous_hash is None:
+                logger.info("Первая проверка. Текущий текст: %.50s...", current_text)
                 print(f"[OK] Элемент на месте! Текст: {current_text[:50]}...")
                 # Отправляем уведомление при первой проверке
-                self._send_telegram_notification('ok', current_text)
-                self.last_ok_notification_time = time.time()
-                self.previous_text = current_text
+                self._observe_state('ok')
+                self._send_telegram_notification('ok', preview)
+                self._previous_hash = current_hash
+                self._previous_preview = preview
                 return True
             
-            if current_text != self.previous_text:
+            if current_hash != self._previous_hash:
                 logger.info("Обнаружено изменение текста элемента!")
-                logger.info(f"Было: {self.previous_text[:50]}...")
-                logger.info(f"Стало: {current_text[:50]}...")
+                logger.info("Было: %.50s...", self._previous_preview)
+                logger.info("Стало: %.50s...", current_text)
                 print("[WARNING] Элемент изменился!")
                 
                 # Отправляем уведомление
-                self._send_telegram_notification('changed', current_text)
+                self._send_telegram_notification('changed', preview)
+                self._record_change()
                 
-                # Обновляем предыдущее значение
-                self.previous_text = current_text
+                # Обновляем предыдущее значение; новый текст - новое стабильное состояние
+                self._previous_hash = current_hash
+                self._previous_preview = preview
+                self._state = ('ok', 1, time.time())
             else:
                 logger.debug("Текст элемента не изменился")
                 print("[OK] Элемент на месте!")
-                # Отправляем "OK" уведомление периодически (раз в час)
-                current_time = time.time()
-                if current_time - self.last_ok_notification_time >= self.ok_notification_interval:
-                    self._send_telegram_notification('ok', current_text)
-                    self.last_ok_notification_time = current_time
+                # Без изменений - только периодическая сводка раз в digest_every проверок
+                self._observe_state('ok')
+                if self._digest_due():
+                    self._send_telegram_notification('ok', preview, self._digest_note())
             
             return True
             
@@ -451,73 +1117,124 @@ class WebMonitor:
             logger.error(f"Неожиданная ошибка при проверке страницы: {e}")
             return False
     
-    def _check_expected_text(self) -> bool:
+    def _check_expected_text(self, current_text: Optional[str], state: Optional[str] = None) -> bool:
         """
         Проверка наличия элемента с ожидаемым текстом
         
+        Args:
+            current_text: Текст найденного элемента или None, если элемент не найден
+            state: Уже известное состояние (страница не изменилась с прошлой проверки)
+        
         Returns:
             True если проверка прошла успешно, False в случае ошибки
         """
-        current_text = None
+        # Определяем состояние элемента: отсутствует, на месте или текст изменился
+        if state is None:
+            if current_text is None:
+                state = 'missing'
+            elif self._expected_cf in current_text.casefold():
+                state = 'ok'
+            else:
+                state = 'changed'
+        if current_text is not None:
+            # Начало текста нужно для уведомлений, когда страница не изменилась и текст не получен заново
+            self._previous_preview = current_text[:200]
         
-        # Если селектор указан, используем его
-        if self.selector and self.selector != 'auto':
-            current_text = self._get_element_text()
-        else:
-            # Иначе ищем элемент по тексту
-            current_text = self._find_element_by_text(self.expected_text)
+        previous_state = self._state[0] if self._state else None
+        transition = self._observe_state(state)
         
-        # Проверяем, найден ли элемент и соответствует ли текст ожидаемому
-        if current_text is None:
-            # Элемент не найден
-            if self.element_found_last_time:
+        if state == 'missing':
+            print("[WARNING] Элемент отсутствует!")
+            if transition:
                 # Элемент пропал - отправляем уведомление
                 logger.warning(f"[WARNING] Элемент '{self.expected_text}' не найден на странице!")
-                print("[WARNING] Элемент отсутствует!")
                 self._send_telegram_notification('missing')
-                self.element_found_last_time = False
+                self._record_change()
             else:
-                logger.debug(f"Элемент '{self.expected_text}' по-прежнему отсутствует")
-                print("[WARNING] Элемент отсутствует!")
-            return True
+                logger.debug("Элемент '%s' по-прежнему отсутствует", self.expected_text)
+                if self._digest_due():
+                    self._send_telegram_notification('missing', None, self._digest_note())
         
-        # Элемент найден, проверяем текст
-        if self.expected_text.lower() in current_text.lower():
+        elif state == 'ok':
             # Текст соответствует ожидаемому
-            current_time = time.time()
-            should_send_ok = False
-            
-            if not self.element_found_last_time:
+            print("[OK] Элемент на месте!")
+            if transition and previous_state is not None:
                 # Элемент снова появился - отправляем уведомление
-                logger.info(f"[OK] Элемент '{self.expected_text}' снова найден!")
-                print("[OK] Элемент на месте!")
+                logger.info("[OK] Элемент '%s' снова найден!", self.expected_text)
                 self._send_telegram_notification('found_again', current_text)
-                self.last_ok_notification_time = current_time
-                should_send_ok = True
+                self._record_change()
+            elif transition:
+                logger.info("[OK] Элемент '%s' присутствует на странице", self.expected_text)
+                self._send_telegram_notification('ok', current_text)
             else:
-                logger.info(f"[OK] Элемент '{self.expected_text}' присутствует на странице")
-                print("[OK] Элемент на месте!")
-                
-                # Отправляем "OK" уведомление, если прошло достаточно времени с последнего
-                if current_time - self.last_ok_notification_time >= self.ok_notification_interval:
-                    self._send_telegram_notification('ok', current_text)
-                    self.last_ok_notification_time = current_time
-                    should_send_ok = True
-            
-            self.element_found_last_time = True
+                logger.info("[OK] Элемент '%s' присутствует на странице", self.expected_text)
+                if self._digest_due():
+                    self._send_telegram_notification('ok', current_text, self._digest_note())
+        
         else:
             # Текст не соответствует ожидаемому
-            logger.warning(f"[WARNING] Элемент найден, но текст изменился!")
-            logger.warning(f"Ожидался: '{self.expected_text}'")
-            logger.warning(f"Найден: '{current_text}'")
+            logger.warning("[WARNING] Элемент найден, но текст изменился!")
+            logger.warning("Ожидался: '%s'", self.expected_text)
+            logger.warning("Найден: '%s'", current_text)
             print(f"[WARNING] Элемент изменился! Ожидался: '{self.expected_text}', найден: '{current_text[:50]}...'")
-            self._send_telegram_notification('changed', current_text)
-            self.element_found_last_time = False
+            if transition:
+                self._send_telegram_notification('changed', current_text)
+                self._record_change()
+            elif self._digest_due():
+                self._send_telegram_notification('changed', current_text, self._digest_note())
         
         return True
     
+    def _observe_state(self, state: str) -> bool:
+        """
+        Учет состояния элемента между проверками
+        
+        Args:
+            state: Текущее состояние ('ok', 'missing', 'changed')
+        
+        Returns:
+            True, если состояние сменилось (нужно отправить уведомление)
+        """
+        if self._state is None or self._state[0] != state:
+            self._state = (state, 1, time.time())
+            return True
+        name, count, since = self._state
+        self._state = (name, count + 1, since)
+        return False
+    
+    def _digest_due(self) -> bool:
+        """Пора ли отправить сводку о неизменном состоянии (раз в digest_every проверок)"""
+        return self._state[1] % self.digest_every == 0
+    
+    def _digest_note(self) -> str:
+        """Строка сводки: сколько проверок подряд и как долго держится состояние"""
+        _, count, since = self._state
+        minutes = int(time.time() - since) // 60
+        if minutes >= 60:
+            duration = f"{minutes // 60} ч {minutes % 60} мин"
+        else:
+            duration = f"{minutes} мин"
+        return f"Без изменений: {count} проверок подряд ({duration})"
+    
+    def _attach_driver(self, driver):
+        """Установка нового драйвера и подготовка ожиданий, переиспользуемых между проверками"""
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        
+        if self._presence_cond is None:
+            # Условие не зависит от драйвера и переживает его перезапуски
+            locator = self._selenium_locator(self.selector, self._selector_kind)
+            self._presence_cond = EC.presence_of_element_located(locator)
+        self.driver = driver
+        self._wait = WebDriverWait(driver, self.element_wait_timeout)
+        self._navigated_once = False
+    
     def _restart_driver(self):
         """Перезапуск WebDriver"""
+        if self.pool is not None:
+            logger.info("Браузеры принадлежат общему пулу, перезапуск пропущен")
+            return
+        
         try:
             if self.driver:
                 self.driver.quit()
@@ -525,39 +1242,208 @@ class WebMonitor:
             logger.warning(f"Ошибка при закрытии драйвера: {e}")
         
         try:
-            self.driver = self._setup_driver()
+            self._attach_driver(self._setup_driver())
         except Exception as e:
             logger.error(f"Не удалось перезапустить драйвер: {e}")
             raise
     
-    def _test_telegram_connection(self) -> bool:
+    async def _test_telegram_connection(self) -> bool:
         """Проверка подключения к Telegram"""
         try:
-            # В python-telegram-bot 20+ методы асинхронные
-            # Создаем новый event loop для каждого вызова
-            try:
-                loop = asyncio.get_running_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-            
-            async def test_async():
-                bot_info = await self.bot.get_me()
-                return bot_info.username
-            
-            if loop.is_running():
-                # Если loop уже запущен, используем asyncio.run
-                username = asyncio.run(test_async())
-            else:
-                username = loop.run_until_complete(test_async())
-            logger.info(f"Telegram бот подключен: @{username}")
+            bot_info = await self.bot.get_me()
+            logger.info(f"Telegram бот подключен: @{bot_info.username}")
             return True
         except Exception as e:
             logger.error(f"Ошибка подключения к Telegram: {e}")
             logger.error("Проверьте правильность токена")
             return False
     
-    def run(self):
+    def _persisted_state(self) -> dict:
+        """Состояние, сохраняемое между запусками"""
+        return {
+            'url': self.url,
+            'selector': self.selector,
+            'expected_text': self.expected_text,
+            'digest': self._previous_hash.hex() if self._previous_hash is not None else None,
+            'preview': self._previous_preview,
+            'state': [self._state[0], self._state[2]] if self._state else None,
+            'count': self._state[1] if self._state else 0,  # Проверок подряд в текущем состоянии (для сводок)
+            'etag': self._etag,
+            'last_modified': self._last_mod,
+            'use_browser': self.use_browser,
+            'static_page': self._static_page,
+        }
+    
+    def _load_state(self):
+        """Восстановление состояния, сохраненного предыдущим запуском"""
+        try:
+            with open(self._state_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning(f"Не удалось прочитать сохраненное состояние: {e}")
+            return
+        
+        # Состояние относится к конкретному элементу: при смене селектора или текста оно не подходит
+        if (data.get('url'), data.get('selector'), data.get('expected_text')) != (
+                self.url, self.selector, self.expected_text):
+            logger.info("Сохраненное состояние относится к другому селектору или тексту и не используется")
+            return
+        
+        # Сначала разбираем все поля, чтобы поврежденный файл не применился частично
+        try:
+            digest = bytes.fromhex(data['digest']) if data.get('digest') else None
+            preview = str(data.get('preview') or '')
+            state = None
+            if data.get('state'):
+                name, since = data['state']
+                state = (str(name), max(1, int(data.get('count') or 1)), float(since))
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Сохраненное состояние повреждено и не используется: {e}")
+            return
+        
+        self._previous_hash = digest
+        self._previous_preview = preview
+        self._state = state
+        self._etag = data.get('etag')
+        self._last_mod = data.get('last_modified')
+        self.use_browser = bool(data.get('use_browser'))
+        self._static_page = bool(data.get('static_page'))
+        self._saved_state = self._persisted_state()
+        logger.info(f"Восстановлено состояние предыдущего запуска: {self._state_path}")
+    
+    def _save_state(self, force: bool = False):
+        """
+        Атомарная запись состояния на диск (только если оно изменилось)
+        
+        Args:
+            force: Записать и тогда, когда изменился только счетчик проверок
+        """
+        data = self._persisted_state()
+        # Счетчик меняется при каждой проверке; в постоянном режиме ради него файл не переписывается
+        if not force and self._saved_state is not None and (
+                {**data, 'count': None} == {**self._saved_state, 'count': None}):
+            return
+        tmp_path = f"{self._state_path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self._state_path)
+            self._saved_state = data
+        except Exception as e:
+            logger.warning(f"Не удалось сохранить состояние: {e}")
+    
+    def _load_change_history(self) -> list:
+        """Загрузка истории изменений элемента для этого URL"""
+        try:
+            with open(HISTORY_PATH, 'r', encoding='utf-8') as f:
+                return list(json.load(f).get(self.url, []))[-self.max_history:]
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            logger.warning(f"Не удалось прочитать историю изменений: {e}")
+            return []
+    
+    def _record_change(self):
+        """Сохранение времени изменения элемента в историю"""
+        self.change_history.append(time.time())
+        self.change_history = self.change_history[-self.max_history:]
+        self._change_fit = self._fit_change_distribution()
+        
+        try:
+            try:
+                with open(HISTORY_PATH, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (FileNotFoundError, ValueError):
+                data = {}
+            data[self.url] = self.change_history
+            with open(HISTORY_PATH, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+        except Exception as e:
+            logger.warning(f"Не удалось сохранить историю изменений: {e}")
+    
+    def _fit_change_distribution(self) -> Optional[tuple]:
+        """
+        Оценка лог-нормального распределения интервалов между изменениями
+        
+        Returns:
+            (mu, sigma, scale) или None, если истории недостаточно.
+            scale - множитель плотности проверок, при котором за типичный цикл
+            изменений расходуется бюджет polls_per_day
+        """
+        history = self.change_history
+        gaps = [b - a for a, b in zip(history, history[1:]) if b > a]
+        if len(gaps) < 3:
+            return None
+        
+        # Оценка максимального правдоподобия для лог-нормального распределения
+        logs = [math.log(g) for g in gaps]
+        mu = sum(logs) / len(logs)
+        sigma = max(0.1, math.sqrt(sum((x - mu) ** 2 for x in logs) / len(logs)))
+        
+        # Нормировка: число проверок на горизонте (99-й перцентиль) равно бюджету
+        horizon = math.exp(mu + 2.33 * sigma)
+        steps = 256
+        step = horizon / steps
+        values = [math.sqrt(self._lognorm_pdf(step * i, mu, sigma)) for i in range(steps + 1)]
+        integral = step * (sum(values) - (values[0] + values[-1]) / 2)
+        if integral <= 0:
+            return None
+        scale = self.polls_per_day * horizon / 86400 / integral
+        return mu, sigma, scale
+    
+    @staticmethod
+    def _lognorm_pdf(t: float, mu: float, sigma: float) -> float:
+        """Плотность лог-нормального распределения"""
+        if t <= 0:
+            return 0.0
+        z = (math.log(t) - mu) / sigma
+        return math.exp(-z * z / 2) / (t * sigma * math.sqrt(2 * math.pi))
+    
+    def _adaptive_interval(self) -> float:
+        """
+        Интервал до следующей проверки с учетом истории изменений
+        
+        Плотность проверок берется пропорциональной sqrt(f(t)), где f - плотность
+        распределения времени между изменениями, а t - время с последнего изменения:
+        при фиксированном бюджете проверок это минимизирует ожидаемую задержку обнаружения.
+        """
+        if self._change_fit is None:
+            return self._stable_interval()
+        
+        mu, sigma, scale = self._change_fit
+        elapsed = time.time() - self.change_history[-1]
+        density = scale * math.sqrt(self._lognorm_pdf(elapsed, mu, sigma))
+        if density <= 0:
+            return self.max_poll_interval
+        return min(self.max_poll_interval, max(self.min_poll_interval, 1 / density))
+    
+    def _stable_interval(self) -> float:
+        """
+        Интервал по числу проверок подряд без изменений (пока истории для оценки недостаточно)
+        
+        Начиная с stable_after-й неизменной проверки интервал удваивается каждый раз
+        (до stable_max_interval); любое изменение сбрасывает счетчик в _state.
+        """
+        stable = self._state[1] - 1 if self._state else 0
+        doublings = min(max(0, stable - self.stable_after + 1), 16)
+        return max(self.poll_interval, min(self.stable_max_interval, self.poll_interval * 2 ** doublings))
+    
+    def _next_sleep(self, success: bool, consecutive_errors: int) -> float:
+        """
+        Интервал до следующей проверки
+        
+        Args:
+            success: Успешна ли последняя проверка
+            consecutive_errors: Количество ошибок подряд
+        """
+        if success:
+            return self._adaptive_interval()
+        # Не нагружаем нестабильный сайт: интервал растет с каждой ошибкой подряд
+        return min(self.backoff_max, self.poll_interval * (self.backoff_base ** consecutive_errors))
+    
+    async def run(self):
         """Основной цикл мониторинга"""
         logger.info("=" * 60)
         logger.info("Запуск веб-монитора")
@@ -567,45 +1453,76 @@ class WebMonitor:
             logger.info(f"Ожидаемый текст: {self.expected_text}")
         logger.info("=" * 60)
         
-        # Проверка подключения к Telegram
-        if not self._test_telegram_connection():
-            logger.error("Не удалось подключиться к Telegram. Проверьте токен и интернет-соединение.")
-            sys.exit(1)
-        
-        # Инициализация драйвера
+        self._tg_task = asyncio.create_task(self._telegram_worker())
         try:
-            self.driver = self._setup_driver()
-        except Exception as e:
-            logger.error(f"Критическая ошибка: не удалось создать WebDriver. {e}")
-            logger.error("Убедитесь, что Chrome и ChromeDriver установлены")
-            sys.exit(1)
+            # Проверка подключения к Telegram
+            if not await self._test_telegram_connection():
+                logger.error("Не удалось подключиться к Telegram. Проверьте токен и интернет-соединение.")
+                sys.exit(1)
+            
+            # Без быстрого HTTP-пути браузер нужен сразу; иначе он запускается при первой необходимости
+            try:
+                if not self._fast_enabled and self.pool is None:
+                    self._attach_driver(await asyncio.to_thread(self._setup_driver))
+            except Exception as e:
+                logger.error(f"Критическая ошибка: не удалось создать WebDriver. {e}")
+                logger.error("Убедитесь, что Chrome и ChromeDriver установлены")
+                sys.exit(1)
+            
+            await self._monitor_loop()
+        except asyncio.CancelledError:
+            logger.info("Получен сигнал остановки. Завершение работы...")
+            raise
+        finally:
+            await self._shutdown()
+    
+    async def run_once(self) -> bool:
+        """
+        Одна проверка страницы и выход (для запуска по таймеру systemd или cron)
+        
+        Состояние прошлой проверки берется из файла состояния, поэтому уведомления
+        отправляются только при реальных изменениях между запусками.
         
+        Returns:
+            True если проверка прошла успешно
+        """
+        self._tg_task = asyncio.create_task(self._telegram_worker())
+        try:
+            success = await self._check_page()
+            if success:
+                # Счетчик проверок сохраняется каждый раз, иначе периодическая сводка не наступит
+                self._save_state(force=True)
+            return success
+        finally:
+            await self._shutdown()
+    
+    async def _monitor_loop(self):
+        """Периодические проверки страницы с перезапуском драйвера при ошибках"""
         consecutive_errors = 0
         max_consecutive_errors = 5
         
         while True:
             try:
-                success = self._check_page()
+                success = await self._check_page()
                 
                 if success:
                     consecutive_errors = 0
-                    logger.info(f"Проверка завершена. Следующая проверка через 3 минуты...")
+                    self._save_state()
+                    delay = self._next_sleep(True, consecutive_errors)
+                    logger.info("Проверка завершена. Следующая проверка через %.0f сек...", delay)
                 else:
                     consecutive_errors += 1
-                    logger.warning(f"Ошибка при проверке (попытка {consecutive_errors}/{max_consecutive_errors})")
+                    delay = self._next_sleep(False, consecutive_errors)
+                    logger.warning("Ошибка при проверке (попытка %d/%d)", consecutive_errors, max_consecutive_errors)
                     
                     # Если слишком много ошибок подряд - перезапускаем драйвер
                     if consecutive_errors >= max_consecutive_errors:
                         logger.warning("Слишком много ошибок подряд. Перезапускаем WebDriver...")
-                        self._restart_driver()
+                        await asyncio.to_thread(self._restart_driver)
                         consecutive_errors = 0
                 
-                # Ждем 3 минуты (180 секунд) до следующей проверки
-                time.sleep(180)
+                await asyncio.sleep(delay)
                 
-            except KeyboardInterrupt:
-                logger.info("Получен сигнал остановки. Завершение работы...")
-                break
             except Exception as e:
                 logger.error(f"Критическая ошибка в основном цикле: {e}")
                 consecutive_errors += 1
@@ -613,20 +1530,148 @@ class WebMonitor:
                 if consecutive_errors >= max_consecutive_errors:
                     logger.error("Критическая ошибка. Перезапускаем WebDriver...")
                     try:
-                        self._restart_driver()
+                        await asyncio.to_thread(self._restart_driver)
                         consecutive_errors = 0
                     except Exception as e2:
                         logger.error(f"Не удалось перезапустить драйвер: {e2}")
-                        logger.error("Ожидание 3 минут перед следующей попыткой...")
-                        time.sleep(180)
-        
+                        delay = self._next_sleep(False, consecutive_errors)
+                        logger.error(f"Ожидание {delay:.0f} сек. перед следующей попыткой...")
+                        await asyncio.sleep(delay)
+    
+    async def _shutdown(self):
+        """Закрытие браузера, HTTP-клиента и Telegram бота"""
         # Закрываем драйвер при выходе
         try:
             if self.driver:
-                self.driver.quit()
+                await asyncio.to_thread(self.driver.quit)
                 logger.info("WebDriver закрыт")
         except Exception as e:
             logger.warning(f"Ошибка при закрытии драйвера: {e}")
+        # chromedriver общего пула останавливает run_monitors после закрытия всех браузеров
+        if self.pool is None:
+            self._stop_service()
+        
+        await self._close_http()
+        await self._close_telegram()
+    
+    async def _close_telegram(self):
+        """Отправка оставшихся уведомлений и закрытие соединений бота"""
+        if self._tg_task is not None:
+            try:
+                self._tg_queue.put_nowait(None)
+                await asyncio.wait_for(self._tg_task, timeout=30)
+            except (asyncio.QueueFull, asyncio.TimeoutError):
+                logger.warning("Не удалось дождаться отправки оставшихся уведомлений")
+                self._tg_task.cancel()
+        
+        try:
+            if hasattr(self.bot, 'shutdown'):
+                await self.bot.shutdown()
+        except Exception as e:
+            logger.warning(f"Ошибка при закрытии Telegram бота: {e}")
+
+class BrowserPool:
+    """
+    Общий пул браузеров для нескольких мониторов
+    
+    Число процессов Chrome ограничено размером пула и не зависит от числа URL:
+    монитор берет браузер только на время загрузки страницы.
+    """
+    
+    def __init__(self, factory: Callable[[int], 'webdriver.Remote'], size: int):
+        """
+        Args:
+            factory: Функция создания нового драйвера (принимает номер браузера в пуле)
+            size: Максимальное число браузеров
+        """
+        self._factory = factory
+        self.size = size
+        # В очереди свободные браузеры; None - сигнал, что место освободилось после удаления браузера
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._drivers = {}  # Драйвер -> номер места в пуле
+        self._free_slots = list(range(size))
+    
+    async def acquire(self) -> 'webdriver.Remote':
+        """Свободный браузер из пула (новый создается, пока в пуле есть место)"""
+        while True:
+            if self._idle.empty() and self._free_slots:
+                return await self._create()
+            driver = await self._idle.get()
+            if driver is not None:
+                return driver
+    
+    async def _create(self) -> 'webdriver.Remote':
+        """Создание браузера на свободном месте пула"""
+        slot = self._free_slots.pop(0)
+        try:
+            driver = await asyncio.to_thread(self._factory, slot)
+        except BaseException:
+            self._free_slot(slot)
+            raise
+        self._drivers[driver] = slot
+        return driver
+    
+    def _free_slot(self, slot: int):
+        """Освобождение места и пробуждение ожидающих браузер"""
+        self._free_slots.append(slot)
+        self._free_slots.sort()
+        self._idle.put_nowait(None)
+    
+    def release(self, driver: 'webdriver.Remote'):
+        """Возврат браузера в пул"""
+        self._idle.put_nowait(driver)
+    
+    async def discard(self, driver: 'webdriver.Remote'):
+        """Закрытие сломанного браузера; на его место при необходимости будет создан новый"""
+        slot = self._drivers.pop(driver, None)
+        try:
+            await asyncio.to_thread(driver.quit)
+        except Exception as e:
+            logger.warning(f"Ошибка при закрытии драйвера: {e}")
+        if slot is not None:
+            self._free_slot(slot)
+    
+    async def close(self):
+        """Закрытие всех браузеров пула"""
+        for driver in self._drivers:
+            try:
+                await asyncio.to_thread(driver.quit)
+            except Exception as e:
+                logger.warning(f"Ошибка при закрытии драйвера: {e}")
+        self._drivers.clear()
+
+
+async def run_monitors(monitors: list, pool_size: Optional[int] = None):
+    """
+    Одновременный мониторинг нескольких URL с общим пулом браузеров
+    
+    Args:
+        monitors: Список WebMonitor
+        pool_size: Число браузеров (по умолчанию половина ядер процессора, минимум 1)
+    """
+    size = pool_size or max(1, (os.cpu_count() or 1) // 2)
+    # Браузеры создаются через первый монитор и его процесс chromedriver
+    owner = monitors[0]
+    pool = BrowserPool(owner._setup_driver, size)
+    for monitor in monitors:
+        monitor.pool = pool
+    
+    try:
+        await asyncio.gather(*(monitor.run() for monitor in monitors))
+    finally:
+        await pool.close()
+        owner._stop_service()
+
+
+async def run_monitors_once(monitors: list) -> bool:
+    """
+    Однократная проверка нескольких URL
+    
+    Returns:
+        True если все проверки прошли успешно
+    """
+    results = await asyncio.gather(*(monitor.run_once() for monitor in monitors))
+    return all(results)
 
 
 def main():
@@ -640,13 +1685,21 @@ def main():
     chat_id = os.getenv('TELEGRAM_CHAT_ID')
     expected_text = os.getenv('MONITOR_EXPECTED_TEXT')
     
+    # Режим одной проверки: процесс завершается после проверки, интервал задает таймер
+    run_once = os.getenv('RUN_ONCE', 'false').lower() == 'true'
+    if '--once' in sys.argv:
+        sys.argv.remove('--once')
+        run_once = True
+    
     # Если параметры не заданы через переменные окружения, используем аргументы
     if not all([url, telegram_token, chat_id]):
         if len(sys.argv) < 4:
             print("Использование:")
-            print("  python web_monitor.py <URL> <TELEGRAM_TOKEN> <CHAT_ID> [SELECTOR] [EXPECTED_TEXT]")
+            print("  python web_monitor.py [--once] <URL> <TELEGRAM_TOKEN> <CHAT_ID> [SELECTOR] [EXPECTED_TEXT]")
+            print("  --once (или RUN_ONCE=true) - одна проверка и выход, для таймера systemd/cron")
             print("\nИли установите переменные окружения:")
             print("  MONITOR_URL, TELEGRAM_TOKEN, TELEGRAM_CHAT_ID")
+            print("  (в MONITOR_URL можно указать несколько URL через пробел - браузеры будут общими)")
             print("  MONITOR_SELECTOR (опционально, по умолчанию 'auto')")
             print("  MONITOR_EXPECTED_TEXT (опционально, для проверки конкретного текста)")
             print("\nПримеры:")
@@ -664,11 +1717,21 @@ def main():
         selector = sys.argv[4] if len(sys.argv) > 4 else 'auto'
         expected_text = sys.argv[5] if len(sys.argv) > 5 else None
     
-    # Создаем и запускаем монитор
-    monitor = WebMonitor(url, selector, telegram_token, chat_id, expected_text)
+    # Создаем и запускаем монитор; несколько URL через пробел - общий пул браузеров
+    urls = url.split()
+    monitors = [WebMonitor(u, selector, telegram_token, chat_id, expected_text) for u in urls]
     
     try:
-        monitor.run()
+        if run_once:
+            if not asyncio.run(run_monitors_once(monitors)):
+                sys.exit(1)
+        elif len(monitors) == 1:
+            asyncio.run(monitors[0].run())
+        else:
+            pool_size = int(os.getenv('BROWSER_POOL_SIZE', '0')) or None
+            asyncio.run(run_monitors(monitors, pool_size))
+    except KeyboardInterrupt:
+        pass
     except Exception as e:
         logger.error(f"Критическая ошибка: {e}")
         sys.exit(1)